@@ -11,7 +11,7 @@ Visit <https://github.com/jwodder/eletter> or <https://eletter.rtfd.io> for
 more information.
 """
 
-__version__ = "0.5.1"
+__version__ = "0.6.0.dev1"
 __author__ = "John Thorvald Wodder II"
 __author_email__ = "eletter@varonathe.org"
 __license__ = "MIT"
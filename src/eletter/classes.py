@@ -1,13 +1,11 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import datetime
 from email import headerregistry as hr
 from email import message_from_binary_file, policy
 from email.message import EmailMessage
-import os
-import os.path
-from typing import MutableSequence, Optional, TypeVar, overload
+from typing import Any, MutableSequence, Optional, TypeVar, overload
 import attr
 from mailbits import ContentType
 from .util import (
@@ -16,16 +14,29 @@ from .util import (
     SingleAddress,
     compile_address,
     compile_addresses,
+    compile_str_address,
+    get_basename,
     get_mime_type,
+    parse_content_type,
 )
 
 
 class Address(hr.Address):
-    """A combination of a person's name and their e-mail address"""
+    """
+    A combination of a person's name and their e-mail address
+
+    .. versionchanged:: 0.6.0
+        `Address` instances are now hashable
+    """
 
     def __init__(self, display_name: str, address: str) -> None:
         super().__init__(display_name=display_name, addr_spec=address)
 
+    def __hash__(self) -> int:  # type: ignore[override]
+        # `hr.Address` is immutable but does not define `__hash__`; hash on
+        # the same fields that `hr.Address.__eq__` compares.
+        return hash((self.display_name, self.username, self.domain))
+
 
 class Group(hr.Group):
     """
@@ -35,42 +46,11 @@ class Group(hr.Group):
     """
 
     def __init__(self, display_name: str, addresses: Iterable[SingleAddress]) -> None:
-        super().__init__(
-            display_name=display_name, addresses=tuple(map(compile_address, addresses))
-        )
+        addrs = [compile_str_address(a) if isinstance(a, str) else a for a in addresses]
+        super().__init__(display_name=display_name, addresses=tuple(addrs))
 
 
-def cache_content_type(
-    ctd: ContentTyped,
-    _attr: Optional[attr.Attribute],
-    value: str,
-) -> None:
-    ct = ContentType.parse(value)
-    if ctd.DEFAULT_CONTENT_TYPE.startswith("text/") and ct.maintype != "text":
-        raise ValueError("content_type must be text/*")
-    ctd._ct = ct
-
-
-@attr.s
-class ContentTyped:
-    DEFAULT_CONTENT_TYPE = "application/octet-stream"
-
-    #: The :mailheader:`Content-Type` of the attachment
-    content_type: str = attr.ib(
-        kw_only=True,
-        default=attr.Factory(  # type: ignore[call-overload]
-            lambda self: self.DEFAULT_CONTENT_TYPE,
-            takes_self=True,
-        ),
-        on_setattr=cache_content_type,
-    )
-    _ct: ContentType = attr.ib(init=False, repr=False, eq=False, order=False)
-
-    def __attrs_post_init__(self) -> None:
-        cache_content_type(self, None, self.content_type)
-
-
-@attr.s
+@attr.s(slots=True)
 class MailItem(ABC):
     """
     .. versionadded:: 0.3.0
@@ -161,89 +141,68 @@ class MailItem(ABC):
             msg["Date"] = date
         if headers is not None:
             for k, v in headers.items():
-                values: list[str]
                 if isinstance(v, str):
-                    values = [v]
+                    msg[k] = v
                 else:
-                    values = list(v)
-                for v2 in values:
-                    msg[k] = v2
+                    for v2 in v:
+                        msg[k] = v2
         return msg
 
     def __or__(self, other: MailItem | str) -> Alternative:
-        parts: list[MailItem] = []
-        for mi in [self, other]:
-            if isinstance(mi, Alternative):
-                parts.extend(mi.content)
-            elif isinstance(mi, str):
-                parts.append(TextBody(mi))
-            else:
-                parts.append(mi)
-        return Alternative(parts)
+        return combine_parts(Alternative, self, other)
 
     def __ror__(self, other: MailItem | str) -> Alternative:
-        parts: list[MailItem] = []
-        for mi in [other, self]:
-            if isinstance(mi, Alternative):
-                parts.extend(mi.content)  # pragma: no cover
-            elif isinstance(mi, str):
-                parts.append(TextBody(mi))
-            else:
-                parts.append(mi)  # pragma: no cover
-        return Alternative(parts)
+        return combine_parts(Alternative, other, self)
 
     def __and__(self, other: MailItem | str) -> Mixed:
-        parts: list[MailItem] = []
-        for mi in [self, other]:
-            if isinstance(mi, Mixed):
-                parts.extend(mi.content)
-            elif isinstance(mi, str):
-                parts.append(TextBody(mi))
-            else:
-                parts.append(mi)
-        return Mixed(parts)
+        return combine_parts(Mixed, self, other)
 
     def __rand__(self, other: MailItem | str) -> Mixed:
-        parts: list[MailItem] = []
-        for mi in [other, self]:
-            if isinstance(mi, Mixed):
-                parts.extend(mi.content)  # pragma: no cover
-            elif isinstance(mi, str):
-                parts.append(TextBody(mi))
-            else:
-                parts.append(mi)  # pragma: no cover
-        return Mixed(parts)
+        return combine_parts(Mixed, other, self)
 
     def __xor__(self, other: MailItem | str) -> Related:
-        parts: list[MailItem] = []
-        for mi in [self, other]:
-            if isinstance(mi, Related):
-                parts.extend(mi.content)
-            elif isinstance(mi, str):
-                parts.append(TextBody(mi))
-            else:
-                parts.append(mi)
-        return Related(parts)
+        return combine_parts(Related, self, other)
 
     def __rxor__(self, other: MailItem | str) -> Related:
-        parts: list[MailItem] = []
-        for mi in [other, self]:
-            if isinstance(mi, Related):
-                parts.extend(mi.content)  # pragma: no cover
-            elif isinstance(mi, str):
-                parts.append(TextBody(mi))
-            else:
-                parts.append(mi)  # pragma: no cover
-        return Related(parts)
+        return combine_parts(Related, other, self)
 
 
 class Attachment(MailItem):
     """Base class for the attachment classes"""
 
-    pass
+    __slots__ = ()
+
+
+def cache_content_type(
+    ctd: TextAttachment | BytesAttachment,
+    _attr: Optional[attr.Attribute],
+    value: str,
+) -> str:
+    ctd._ct = parse_content_type(value)
+    return value
+
+
+def cache_text_content_type(
+    ctd: TextAttachment | BytesAttachment,
+    _attr: Optional[attr.Attribute],
+    value: str,
+) -> str:
+    ct = parse_content_type(value)
+    if ct.maintype != "text":
+        raise ValueError("content_type must be text/*")
+    ctd._ct = ct
+    return value
+
+
+@attr.s(slots=True)
+class ContentTyped(MailItem):
+    """
+    Base class for attachments with a ``content_type``.  Each subclass
+    declares ``content_type`` followed by the cached ``_ct`` field.
+    """
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class TextAttachment(Attachment, ContentTyped):
     """
     A textual e-mail attachment.  ``content_type`` defaults to ``"text/plain"``
@@ -252,6 +211,13 @@ class TextAttachment(Attachment, ContentTyped):
 
     DEFAULT_CONTENT_TYPE = "text/plain"
 
+    #: The :mailheader:`Content-Type` of the attachment
+    content_type: str = attr.ib(
+        default=DEFAULT_CONTENT_TYPE,
+        kw_only=True,
+        on_setattr=cache_text_content_type,
+    )
+    _ct: ContentType = attr.ib(init=False, repr=False, eq=False, order=False)
     #: The body of the attachment
     content: str
     #: The filename of the attachment
@@ -262,11 +228,14 @@ class TextAttachment(Attachment, ContentTyped):
     #: Whether the attachment should be displayed inline in clients
     inline: bool = attr.ib(default=False, kw_only=True)
 
+    def __attrs_post_init__(self) -> None:
+        cache_text_content_type(self, None, self.content_type)
+
     def _compile(self) -> EmailMessage:
         assert self._ct.maintype == "text", "Content-Type is not text/*"
-        params = dict(self._ct.params)
-        charset = params.pop("charset", "utf-8")
-        msg = EmailMessage()
+        charset = self._ct.params.get("charset", "utf-8")
+        params = {k: v for k, v in self._ct.params.items() if k != "charset"}
+        msg = EmailMessage(policy=policy.default)
         msg.set_content(
             self.content,
             subtype=self._ct.subtype,
@@ -303,7 +272,7 @@ class TextAttachment(Attachment, ContentTyped):
         """
         with open(path, "r", encoding=encoding, errors=errors) as fp:
             content = fp.read()
-        filename = os.path.basename(os.fsdecode(path))
+        filename = get_basename(path)
         if content_type is None:
             content_type = get_mime_type(filename)
         return cls(
@@ -315,13 +284,22 @@ class TextAttachment(Attachment, ContentTyped):
         )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class BytesAttachment(Attachment, ContentTyped):
     """
     A binary e-mail attachment.  `content_type` defaults to
     ``"application/octet-stream"``.
     """
 
+    DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+    #: The :mailheader:`Content-Type` of the attachment
+    content_type: str = attr.ib(
+        default=DEFAULT_CONTENT_TYPE,
+        kw_only=True,
+        on_setattr=cache_content_type,
+    )
+    _ct: ContentType = attr.ib(init=False, repr=False, eq=False, order=False)
     #: The body of the attachment
     content: bytes
     #: The filename of the attachment
@@ -332,8 +310,11 @@ class BytesAttachment(Attachment, ContentTyped):
     #: Whether the attachment should be displayed inline in clients
     inline: bool = attr.ib(default=False, kw_only=True)
 
+    def __attrs_post_init__(self) -> None:
+        cache_content_type(self, None, self.content_type)
+
     def _compile(self) -> EmailMessage:
-        msg = EmailMessage()
+        msg = EmailMessage(policy=policy.default)
         msg.set_content(
             self.content,
             self._ct.maintype,
@@ -365,9 +346,11 @@ class BytesAttachment(Attachment, ContentTyped):
         .. versionchanged:: 0.3.0
             ``inline`` and ``content_id`` arguments added
         """
-        with open(path, "rb") as fp:
+        # The whole file is read at once, so skip the buffering layer and let
+        # `FileIO.readall()` size the result from the file's stat.
+        with open(path, "rb", buffering=0) as fp:
             content = fp.read()
-        filename = os.path.basename(os.fsdecode(path))
+        filename = get_basename(path)
         if content_type is None:
             content_type = get_mime_type(filename)
         return cls(
@@ -379,7 +362,7 @@ class BytesAttachment(Attachment, ContentTyped):
         )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class EmailAttachment(Attachment):
     """
     .. versionadded:: 0.2.0
@@ -398,7 +381,7 @@ class EmailAttachment(Attachment):
     inline: bool = attr.ib(default=False, kw_only=True)
 
     def _compile(self) -> EmailMessage:
-        msg = EmailMessage()
+        msg = EmailMessage(policy=policy.default)
         msg.set_content(
             self.content,
             disposition="inline" if self.inline else "attachment",
@@ -420,7 +403,7 @@ class EmailAttachment(Attachment):
             # <https://github.com/python/typeshed/issues/13273>
             content = message_from_binary_file(fp, policy=policy.default)  # type: ignore[arg-type]
             assert isinstance(content, EmailMessage)
-        filename = os.path.basename(os.fsdecode(path))
+        filename = get_basename(path)
         return cls(
             content=content, filename=filename, inline=inline, content_id=content_id
         )
@@ -433,7 +416,27 @@ def mail_item_list(xs: Iterable[MailItem]) -> list[MailItem]:
 M = TypeVar("M", bound="Multipart")
 
 
-@attr.s
+def combine_parts(cls: type[M], left: MailItem | str, right: MailItem | str) -> M:
+    """
+    Combine two operands of ``|``, ``&``, or ``^`` into a new instance of
+    ``cls``, flattening any operands that are already instances of ``cls`` and
+    converting `str`\\s to `TextBody`\\s
+    """
+    combined = cls()
+    # Fill in the new instance's own list rather than passing a list to the
+    # constructor, which would be copied again by `mail_item_list()`
+    parts = combined.content
+    for mi in (left, right):
+        if isinstance(mi, cls):
+            parts.extend(mi.content)
+        elif isinstance(mi, str):
+            parts.append(TextBody(mi))
+        else:
+            parts.append(mi)
+    return combined
+
+
+@attr.s(slots=True)
 class Multipart(MailItem, MutableSequence[MailItem]):
     """
     .. versionadded:: 0.3.0
@@ -480,6 +483,26 @@ class Multipart(MailItem, MutableSequence[MailItem]):
     def __len__(self) -> int:
         return len(self.content)
 
+    def __iter__(self) -> Iterator[MailItem]:
+        return iter(self.content)
+
+    def __reversed__(self) -> Iterator[MailItem]:
+        return reversed(self.content)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.content
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """:meta private:"""
+        if stop is None:
+            return self.content.index(value, start)
+        else:
+            return self.content.index(value, start, stop)
+
+    def count(self, value: Any) -> int:
+        """:meta private:"""
+        return self.content.count(value)
+
     def insert(self, index: int, value: MailItem) -> None:
         """:meta private:"""
         self.content.insert(index, value)
@@ -504,12 +527,16 @@ class Multipart(MailItem, MutableSequence[MailItem]):
         """:meta private:"""
         self.content.remove(value)
 
+    def clear(self) -> None:
+        """:meta private:"""
+        self.content.clear()
+
     def __iadd__(self: M, other: Iterable[MailItem]) -> M:
         self.content.extend(other)
         return self
 
 
-@attr.s
+@attr.s(slots=True)
 class Alternative(Multipart):
     """
     .. versionadded:: 0.3.0
@@ -580,7 +607,7 @@ class Alternative(Multipart):
     def _compile(self) -> EmailMessage:
         if not self.content:
             raise ValueError("Cannot compose empty Alternative")
-        msg = EmailMessage()
+        msg = EmailMessage(policy=policy.default)
         msg.make_alternative()
         for mi in self.content:
             msg.attach(mi._compile())
@@ -598,7 +625,7 @@ class Alternative(Multipart):
         return self
 
 
-@attr.s
+@attr.s(slots=True)
 class Mixed(Multipart):
     """
     .. versionadded:: 0.3.0
@@ -677,7 +704,7 @@ class Mixed(Multipart):
     def _compile(self) -> EmailMessage:
         if not self.content:
             raise ValueError("Cannot compose empty Mixed")
-        msg = EmailMessage()
+        msg = EmailMessage(policy=policy.default)
         msg.make_mixed()
         for mi in self.content:
             msg.attach(mi._compile())
@@ -695,7 +722,7 @@ class Mixed(Multipart):
         return self
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Related(Multipart):
     """
     .. versionadded:: 0.3.0
@@ -820,7 +847,7 @@ class Related(Multipart):
     def _compile(self) -> EmailMessage:
         if not self.content:
             raise ValueError("Cannot compose empty Related")
-        msg = EmailMessage()
+        msg = EmailMessage(policy=policy.default)
         msg.make_related()
         ctype: Optional[str] = None
         for mi in self.content:
@@ -849,7 +876,7 @@ class Related(Multipart):
         return self
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class TextBody(MailItem):
     """
     .. versionadded:: 0.3.0
@@ -861,12 +888,12 @@ class TextBody(MailItem):
     content: str
 
     def _compile(self) -> EmailMessage:
-        msg = EmailMessage()
+        msg = EmailMessage(policy=policy.default)
         msg.set_content(self.content, cid=self.content_id)
         return msg
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class HTMLBody(MailItem):
     """
     .. versionadded:: 0.3.0
@@ -878,6 +905,6 @@ class HTMLBody(MailItem):
     content: str
 
     def _compile(self) -> EmailMessage:
-        msg = EmailMessage()
+        msg = EmailMessage(policy=policy.default)
         msg.set_content(self.content, subtype="html", cid=self.content_id)
         return msg
@@ -134,12 +134,14 @@ def reply_quote(s: str, prefix: str = "> ") -> str:
 
     __ https://en.wikipedia.org/wiki/Usenet_quoting
     """
-    s2 = ""
+    stripped = prefix.rstrip()
+    lines = []
     for ln in (s or "\n").splitlines(True):
         if ln.startswith(prefix):
-            s2 += prefix.rstrip() + ln
+            lines.append(stripped + ln)
         else:
-            s2 += prefix + ln
+            lines.append(prefix + ln)
+    s2 = "".join(lines)
     if not s2.endswith(("\n", "\r")):
         s2 += "\n"
     return s2
@@ -1,9 +1,12 @@
 from __future__ import annotations
 from collections.abc import Iterable
 from email import headerregistry as hr
+from functools import lru_cache
 from mimetypes import guess_type
 import os
+import re
 from typing import Union
+from mailbits import ContentType
 
 AnyPath = Union[bytes, str, "os.PathLike[bytes]", "os.PathLike[str]"]
 
@@ -11,10 +14,23 @@ SingleAddress = Union[str, hr.Address]
 
 AddressOrGroup = Union[str, hr.Address, hr.Group]
 
+#: Regex matching a :mailheader:`Content-Type` that consists of just a maintype
+#: and subtype made up of :RFC:`2045` token characters
+BARE_CONTENT_TYPE_RGX = re.compile(
+    r"([-!#$%&'*+.^_`{|}~0-9A-Za-z]+)/([-!#$%&'*+.^_`{|}~0-9A-Za-z]+)"
+)
+
+
+@lru_cache(maxsize=1024)
+def compile_str_address(addr: str) -> hr.Address:
+    # `hr.Address` instances are immutable, so the same object can be handed
+    # out for every occurrence of an address string.
+    return hr.Address(addr_spec=addr)
+
 
 def compile_address(addr: SingleAddress) -> hr.Address:
     if isinstance(addr, str):
-        return hr.Address(addr_spec=addr)
+        return compile_str_address(addr)
     else:
         return addr
 
@@ -23,11 +39,35 @@ def compile_addresses(
     addrs: AddressOrGroup | Iterable[AddressOrGroup],
 ) -> list[hr.Address | hr.Group]:
     if isinstance(addrs, str):
-        return [hr.Address(addr_spec=addrs)]
+        return [compile_str_address(addrs)]
     elif not isinstance(addrs, Iterable):
         return [addrs]
     else:
-        return [hr.Address(addr_spec=a) if isinstance(a, str) else a for a in addrs]
+        return [compile_str_address(a) if isinstance(a, str) else a for a in addrs]
+
+
+@lru_cache(maxsize=128)
+def parse_content_type(s: str) -> ContentType:
+    """
+    Parse a :mailheader:`Content-Type` string into a `ContentType`, caching
+    the result.  As the returned object is shared between all callers that
+    pass the same string, it must not be mutated.
+
+    :raises ValueError: if ``s`` is not a valid :mailheader:`Content-Type`
+    """
+    m = BARE_CONTENT_TYPE_RGX.fullmatch(s)
+    if m:
+        # Nothing for the full header parser to do here
+        return ContentType(m[1].lower(), m[2].lower())
+    return ContentType.parse(s)
+
+
+def get_basename(path: AnyPath) -> str:
+    """Return the final component of ``path`` as a `str`"""
+    if isinstance(path, str):
+        return os.path.basename(path)
+    else:
+        return os.path.basename(os.fsdecode(path))
 
 
 def get_mime_type(filename: str, strict: bool = False) -> str:
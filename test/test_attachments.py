@@ -1,3 +1,4 @@
+from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 import attr
@@ -62,6 +63,13 @@ def test_text_attachment_set_bad_content_type() -> None:
     assert a._ct == ContentType("text", "plain", {})
 
 
+def test_text_attachment_set_content_type() -> None:
+    a = TextAttachment("[]", filename="foo.json")
+    a.content_type = "text/x-json; charset=utf-8"
+    assert a.content_type == "text/x-json; charset=utf-8"
+    assert a._ct == ContentType("text", "x-json", {"charset": "utf-8"})
+
+
 def test_bytes_attachment_bad_content_type() -> None:
     with pytest.raises(ValueError) as excinfo:
         BytesAttachment(b"[]", filename="foo.json", content_type="application-json")
@@ -77,6 +85,13 @@ def test_bytes_attachment_set_bad_content_type() -> None:
     assert a._ct == ContentType("application", "octet-stream", {})
 
 
+def test_bytes_attachment_set_content_type() -> None:
+    a = BytesAttachment(b"[]", filename="foo.json")
+    a.content_type = "application/json"
+    assert a.content_type == "application/json"
+    assert a._ct == ContentType("application", "json", {})
+
+
 def test_bytes_attachment_from_file() -> None:
     ba = BytesAttachment.from_file(ATTACH_DIR / "ternary.png")
     assert ba == BytesAttachment(
@@ -220,3 +235,17 @@ def test_email_attachment_from_file(inline: bool, cid: Optional[None]) -> None:
         ],
         "epilogue": "",
     }
+
+
+@pytest.mark.parametrize(
+    "attachment",
+    [
+        TextAttachment(PY, filename="fibonacci.py"),
+        BytesAttachment(PNG, filename="ternary.png"),
+        EmailAttachment.from_file(ATTACH_DIR / "sample.eml"),
+    ],
+)
+def test_attachment_slots(
+    attachment: TextAttachment | BytesAttachment | EmailAttachment,
+) -> None:
+    assert not hasattr(attachment, "__dict__")
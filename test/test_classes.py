@@ -1245,6 +1245,20 @@ def test_multipart_mutable_sequences(cls: type[Multipart]) -> None:
     assert len(seq) == 1
     assert list(seq) == [t4]
     assert bool(seq)
+    seq.extend([t2, t4])
+    assert t2 in seq
+    assert t1 not in seq
+    assert seq.index(t4) == 0
+    assert seq.index(t4, 1) == 2
+    assert seq.index(t4, 1, None) == 2
+    assert seq.index(t2, 0, 2) == 1
+    assert seq.count(t4) == 2
+    assert seq.count(t1) == 0
+    assert list(reversed(seq)) == [t4, t2, t4]
+    seq.clear()
+    assert len(seq) == 0
+    assert list(seq) == []
+    assert not bool(seq)
 
 
 def test_str_or_html() -> None:
@@ -1402,3 +1416,29 @@ def test_body_xor_eq_str() -> None:
     assert x == Related([h, TextBody(t)])
     assert h == HTMLBody("<p>This is the <i>text</i> of an <b>e</b>-mail.<p>")
     assert t == "This is the text of an e-mail."
+
+
+def test_address_hashable() -> None:
+    addrs = {
+        Address("Thaddeus Hem", "them@hither.yon"),
+        Address("Thaddeus Hem", "them@hither.yon"),
+        Address("", "them@hither.yon"),
+    }
+    assert addrs == {
+        Address("Thaddeus Hem", "them@hither.yon"),
+        Address("", "them@hither.yon"),
+    }
+
+
+@pytest.mark.parametrize(
+    "mi",
+    [
+        TextBody("This is the text of an e-mail."),
+        HTMLBody("<p>This is the <i>text</i> of an <b>e</b>-mail.<p>"),
+        Alternative(),
+        Mixed(),
+        Related(),
+    ],
+)
+def test_mail_item_slots(mi: MailItem) -> None:
+    assert not hasattr(mi, "__dict__")
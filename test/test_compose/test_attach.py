@@ -1,3 +1,5 @@
+from __future__ import annotations
+from collections.abc import Iterator
 from mailbits import email2dict
 from eletter import Address, BytesAttachment, EmailAttachment, TextAttachment, compose
 
@@ -1282,3 +1284,37 @@ def test_compose_text_bytes_attachment_null_filename() -> None:
         ],
         "epilogue": None,
     }
+
+
+def test_compose_no_attachments() -> None:
+    msg = compose(
+        from_="me@here.com",
+        to=["you@there.net"],
+        subject="Some electronic mail",
+        text="This is the text of an e-mail.",
+        attachments=[],
+    )
+    assert msg.get_content_type() == "text/plain"
+    assert msg.get_content() == "This is the text of an e-mail.\n"
+
+
+def test_compose_attachments_generator() -> None:
+    def gen_attachments() -> Iterator[BytesAttachment]:
+        for i in range(3):
+            yield BytesAttachment(bytes([i]), filename=f"blob{i}.dat")
+
+    msg = compose(
+        from_="me@here.com",
+        to=["you@there.net"],
+        subject="Some electronic mail",
+        text="This is the text of an e-mail.",
+        attachments=gen_attachments(),
+    )
+    assert msg.get_content_type() == "multipart/mixed"
+    parts = list(msg.iter_parts())
+    assert [p.get_filename() for p in parts] == [
+        None,
+        "blob0.dat",
+        "blob1.dat",
+        "blob2.dat",
+    ]
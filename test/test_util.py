@@ -1,7 +1,16 @@
 from __future__ import annotations
+from email import headerregistry as hr
+from pathlib import Path
+from mailbits import ContentType
 import pytest
 from eletter import assemble_content_type, reply_quote
-from eletter.util import get_mime_type
+from eletter.util import (
+    compile_address,
+    compile_addresses,
+    get_basename,
+    get_mime_type,
+    parse_content_type,
+)
 
 
 @pytest.mark.parametrize(
@@ -18,6 +27,14 @@ from eletter.util import get_mime_type
             {"charset": "utf-8", "variant": "GFM"},
             'text/markdown; charset="utf-8"; variant="GFM"',
         ),
+        ("text", "plain", {"flag": ""}, "text/plain; flag"),
+        (
+            "text",
+            "plain",
+            {"charset": "us-ascii", "Charset": "utf-8"},
+            'text/plain; Charset="utf-8"',
+        ),
+        ("text", "plain", {'q"': "x", "name": "y"}, 'text/plain; name="y"'),
     ],
 )
 def test_assemble_content_type(
@@ -40,6 +57,54 @@ def test_assemble_content_type_error(maintype: str, subtype: str) -> None:
     assert str(excinfo.value) == f"{maintype}/{subtype}"
 
 
+@pytest.mark.parametrize("value", ["x.pdf\r\nBcc: victim@evil.test", "x\ny"])
+def test_assemble_content_type_linebreak(value: str) -> None:
+    with pytest.raises(ValueError):
+        assemble_content_type("application", "pdf", name=value)
+
+
+def test_parse_content_type_cached() -> None:
+    ct = parse_content_type('text/markdown; charset="utf-8"')
+    assert ct.content_type == "text/markdown"
+    assert ct.params == {"charset": "utf-8"}
+    assert parse_content_type('text/markdown; charset="utf-8"') is ct
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        "text/plain",
+        "TEXT/PLAIN",
+        "image/svg+xml",
+        "application/vnd.ms-excel",
+        "x-foo/x!#$%&'*+-.^_`{|}~",
+        "text/plain; charset=utf-8",
+        " text/plain ",
+        "text/plain (comment)",
+    ],
+)
+def test_parse_content_type_matches_full_parser(s: str) -> None:
+    assert parse_content_type(s) == ContentType.parse(s)
+
+
+def test_parse_content_type_error() -> None:
+    with pytest.raises(ValueError):
+        parse_content_type("application-json")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "foo/bar/résumé.txt",
+        "résumé.txt",
+        "foo/bar/résumé.txt".encode("utf-8"),
+        Path("foo", "bar", "résumé.txt"),
+    ],
+)
+def test_get_basename(path: str | bytes | Path) -> None:
+    assert get_basename(path) == "résumé.txt"
+
+
 @pytest.mark.parametrize(
     "filename,mtype",
     [
@@ -107,3 +172,11 @@ def test_reply_quote_custom_prefix() -> None:
         reply_quote("Insert output here.\n\n: Outsert input there.\n", ": ")
         == ": Insert output here.\n: \n:: Outsert input there.\n"
     )
+
+
+def test_compile_address_cached() -> None:
+    addr = compile_address("me@here.com")
+    assert isinstance(addr, hr.Address)
+    assert addr.addr_spec == "me@here.com"
+    assert compile_address("me@here.com") is addr
+    assert compile_addresses(["you@there.net", "me@here.com"])[1] is addr